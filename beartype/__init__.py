@@ -18,7 +18,7 @@ constants are commonly inspected (and thus expected) by external automation.
 # ....................{ IMPORTS                            }....................
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 # CAUTION: Explicitly list *ALL* public attributes imported below in the
-# "__all__" list global declared below to avoid linter complaints.
+# "__all__" tuple global declared below to avoid linter complaints.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 # CAUTION: To avoid polluting the public module namespace, external attributes
 # should be locally imported at module scope *ONLY* under alternate private
@@ -26,33 +26,32 @@ constants are commonly inspected (and thus expected) by external automation.
 # than merely "from argparse import ArgumentParser").
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+from typing import (
+    TYPE_CHECKING,  # <-- *MUST* be import as "TYPE_CHECKING" or mypy ignores it
+)
+from beartype.meta import (
+    VERSION as _VERSION,
+    VERSION_PARTS as _VERSION_PARTS,
+)
+
 # ....................{ GLOBALS                            }....................
-# Initialized below by the _init() function. As a temporary fallback, this
-# global is initialized to a placeholder tuple of integers to satisfy static
-# type-checkers (e.g., mypy, pyright).
-__version__ = '0.1.0'
+__version__ = _VERSION
 '''
 Human-readable package version as a ``.``-delimited string.
 
 For :pep:`8` compliance, this specifier has the canonical name ``__version__``
 rather than that of a typical global (e.g., ``VERSION_STR``).
 
-Note that this is the canonical version specifier for this package. Indeed, the
-top-level ``pyproject.toml`` file dynamically derives its own ``version`` string
-from this string global.
-
 See Also
 --------
-pyproject.toml
-   The Hatch-specific ``[tool.hatch.version]`` subsection of the top-level
-   ``pyproject.toml`` file, which parses its version from this string global.
+:data:`beartype.meta.VERSION`
+   Canonical version specifier for this package, from which the Hatch-specific
+   ``[tool.hatch.version]`` subsection of the top-level ``pyproject.toml`` file
+   parses its version.
 '''
 
 
-# Initialized below by the _init() function. As a temporary fallback, this
-# global is initialized to a placeholder tuple of integers to satisfy static
-# type-checkers (e.g., mypy, pyright).
-__version_info__ = (0, 1, 0)
+__version_info__ = _VERSION_PARTS
 '''
 Machine-readable package version as a tuple of integers.
 
@@ -69,23 +68,11 @@ def _init() -> None:
 
     # Defer function-specific imports for safety.
     from beartype.meta import (
-        VERSION,
-        VERSION_PARTS,
         PYTHON_VERSION_MIN,
         PYTHON_VERSION_MIN_PARTS,
     )
     from sys import version_info
 
-    # Global variables to be redefined below.
-    global \
-        __version__, \
-        __version_info__
-
-    # Alias PEP 8-compliant string globals defined by this submodule to PEP
-    # 8-noncompliant string globals defined elsewhere.
-    __version__      = VERSION
-    __version_info__ = VERSION_PARTS  # type: ignore[assignment]
-
     # If this physical distribution installed with this package defines the
     # "Requires-Python" key underlying the "PYTHON_VERSION_MIN" string constant,
     # validate the version of the active Python interpreter *BEFORE* subsequent
@@ -153,10 +140,21 @@ _init()
 # Import from the "beartype" codebase *AFTER* initializing this submodule above,
 # thus validating the active Python interpreter to satisfy requirements.
 
-# Publicize the private @beartype._decor.beartype decorator as
-# @beartype.beartype, preserving all implementation details as private.
-from beartype._decor.decormain import (
-    beartype as beartype)
+# Note that the @beartype.beartype decorator is intentionally *NOT* imported
+# here. Doing so would transitively import the entirety of the type-checking
+# code generation machinery, dominating the cost of importing this package even
+# for callers only inspecting metadata (e.g., "__version__") or configuration.
+# Instead, the __getattr__() dunder function defined below lazily imports that
+# decorator on the first access of the "beartype.beartype" attribute.
+#
+# If performing static type-checking, expose that decorator to static
+# type-checkers as a standard attribute of this package.
+if TYPE_CHECKING:
+    from beartype._decor.decormain import (
+        beartype as beartype)
+
+# Remove this attribute imported above from this package namespace.
+del TYPE_CHECKING
 
 # Publicize all top-level configuration attributes required to configure the
 # @beartype.beartype decorator.
@@ -171,7 +169,7 @@ from beartype._conf.confoverrides import (
     BeartypeHintOverrides as BeartypeHintOverrides)
 
 # ....................{ GLOBALS ~ __all__                  }....................
-__all__ = [
+__all__ = (
     'BeartypeConf',
     'BeartypeDecorationPosition',
     'BeartypeHintOverrides',
@@ -180,9 +178,9 @@ __all__ = [
     'beartype',
     '__version__',
     '__version_info__',
-]
+)
 '''
-Special list global of the unqualified names of all public package attributes
+Special tuple global of the unqualified names of all public package attributes
 explicitly exported by and thus safely importable from this package.
 
 Caveats
@@ -206,26 +204,32 @@ example, :mod:`mypy` emits an error resembling:
 # ....................{ DUNDERS                            }....................
 def __getattr__(attr_name: str) -> object:
     '''
-    Dynamically retrieve a deprecated attribute with the passed unqualified name
-    from this submodule and emit a non-fatal deprecation warning on each such
-    retrieval if this submodule defines this attribute *or* raise an exception
-    otherwise.
+    Dynamically retrieve either a lazily imported attribute *or* a deprecated
+    attribute with the passed unqualified name from this submodule, emitting a
+    non-fatal deprecation warning on each retrieval of the latter, if this
+    submodule defines this attribute *or* raise an exception otherwise.
 
     The Python interpreter implicitly calls this :pep:`562`-compliant module
     dunder function under Python >= 3.7 *after* failing to directly retrieve an
-    explicit attribute with this name from this submodule. Since this dunder
-    function is only called in the event of an error, neither space nor time
-    efficiency are a concern here.
+    explicit attribute with this name from this submodule. This function
+    lazily imports the following attributes on their first retrieval, which
+    this function then caches as explicit attributes of this submodule:
+
+    * The :func:`beartype.beartype` decorator, whose importation transitively
+      imports the entirety of the type-checking code generation machinery.
+
+    Since this function is otherwise only called in the event of an error,
+    neither space nor time efficiency are a concern here.
 
     Parameters
     ----------
     attr_name : str
-        Unqualified name of the deprecated attribute to be retrieved.
+        Unqualified name of the attribute to be retrieved.
 
     Returns
     -------
     object
-        Value of this deprecated attribute.
+        Value of this attribute.
 
     Warns
     -----
@@ -238,6 +242,16 @@ def __getattr__(attr_name: str) -> object:
         If this attribute is unrecognized and thus erroneous.
     '''
 
+    # If this attribute is the @beartype.beartype decorator, lazily import this
+    # decorator *AND* cache this decorator as an explicit attribute of this
+    # package. Doing so guarantees that the Python interpreter never calls this
+    # dunder function again on subsequent retrievals of this decorator.
+    if attr_name == 'beartype':
+        from beartype._decor.decormain import beartype as decorator
+        globals()['beartype'] = decorator
+        return decorator
+    # Else, this attribute is *NOT* the @beartype.beartype decorator.
+
     # Isolate imports to avoid polluting the module namespace.
     from beartype._util.module.utilmoddeprecate import deprecate_module_attr
 
@@ -67,11 +67,13 @@ from beartype._data.hint.datahinttyping import (
     TypeStack,
 )
 from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
 from beartype._util.error.utilerrraise import reraise_exception_placeholder
 from beartype._util.error.utilerrwarn import reissue_warnings_placeholder
 from beartype._util.func.utilfuncmake import make_func
 from beartype._util.hint.pep.proposal.pep484585.pep484585ref import (
     get_hint_pep484585_ref_names_relative_to)
+from beartype._util.utilobject import is_object_hashable
 from itertools import count
 from warnings import (
     catch_warnings,
@@ -546,6 +548,23 @@ integer incrementation starting at 0, leveraged by the
 functions dynamically generated by that factory).
 '''
 
+
+_HINT_UNHASHABLE_ID_TO_FUNC_CHECKER = CacheLruStrong(size=256)
+'''
+**Unhashable type-checking function cache** (i.e., thread-safe LRU cache
+mapping from a 4-tuple ``(hint_id, conf, make_code_check, exception_prefix)``
+uniquely identifying a call to the :func:`._make_func_checker` factory passed
+an **unhashable type hint** whose object identifier is ``hint_id`` to the
+2-tuple ``(hint, func_checker)``, where ``hint`` is that hint and
+``func_checker`` is the type-checking function generated by that factory for
+that hint).
+
+This cache strongly refers to these hints, guaranteeing that the object
+identifiers of these hints remain unique for as long as these hints remain
+cached. This cache is bounded to avoid leaking memory when callers pass
+distinct unhashable hints on each call to a high-level type-checker.
+'''
+
 # ....................{ PRIVATE ~ testers                  }....................
 def _func_checker_ignorable(obj: object) -> bool:
     '''
@@ -581,10 +600,22 @@ def _make_func_checker(
 
     This factory is intentionally *not* memoized (e.g., by the
     ``@callable_cached`` decorator), as this factory is only called by
-    higher-level memoized factories.
+    higher-level memoized factories. Since those factories silently fail to
+    memoize calls passed **unhashable type hints** (e.g.,
+    ``typing.Annotated[int, []]``), this factory instead memoizes those calls
+    to a bounded LRU cache keyed on the object identifiers of those hints.
+    Doing so avoids regenerating a new type-checking function on *every* call
+    to a high-level type-checker (e.g., :func:`beartype.door.is_bearable`)
+    passed the same unhashable hint.
 
     Caveats
     -------
+    **Unhashable hints are assumed to be immutable.** Since this factory keys
+    unhashable hints by object identifier, the type-checking function
+    previously generated for an unhashable hint is returned as is even if the
+    caller has since mutated the contents of that hint. Since type hints are
+    effectively immutable in practice, this is considered a non-issue.
+
     **This factory intentionally accepts no** ``exception_cls`` **parameter.**
     Doing so would only ambiguously obscure context-sensitive exceptions raised
     by lower-level utility functions called by this higher-level factory.
@@ -631,6 +662,75 @@ def _make_func_checker(
     '''
     assert callable(make_code_check), f'{repr(make_code_check)} uncallable.'
 
+    # If this hint is hashable, the memoized parent factory calling this factory
+    # (e.g., make_func_tester()) already memoized this call. In this case,
+    # defer to this lower-level factory.
+    if is_object_hashable(hint):
+        return _make_func_checker_uncached(
+            hint, conf, make_code_check, exception_prefix)
+    # Else, this hint is unhashable. In this case, that parent factory silently
+    # failed to memoize this call.
+
+    # Hashable key uniquely identifying this call.
+    func_checker_key = (id(hint), conf, make_code_check, exception_prefix)
+
+    # Attempt to...
+    try:
+        # Retrieve the 2-tuple "(hint, func_checker)" previously cached under
+        # this key, where "hint" is the unhashable hint previously passed to
+        # this factory and "func_checker" is the type-checking function
+        # previously generated for that hint.
+        hint_cached, func_checker = _HINT_UNHASHABLE_ID_TO_FUNC_CHECKER[
+            func_checker_key]  # type: ignore[misc]
+
+        # If that hint is this hint, return that function.
+        #
+        # Note that this should *ALWAYS* be the case. Since this cache strongly
+        # refers to that hint, the object identifier of that hint *CANNOT* be
+        # recycled for another object while that hint remains cached. Still,
+        # this test is sufficiently cheap to be worth performing for safety.
+        if hint_cached is hint:
+            return func_checker  # type: ignore[return-value]
+        # Else, that hint is *NOT* this hint.
+    # If *NO* such 2-tuple was previously cached, silently continue.
+    except KeyError:
+        pass
+
+    # Type-checking function generated for this hint.
+    func_checker = _make_func_checker_uncached(
+        hint, conf, make_code_check, exception_prefix)
+
+    # Cache this function with this hint, strongly referring to this hint to
+    # prevent the object identifier of this hint from being recycled.
+    _HINT_UNHASHABLE_ID_TO_FUNC_CHECKER[func_checker_key] = (
+        hint, func_checker)
+
+    # Return this function.
+    return func_checker
+
+
+def _make_func_checker_uncached(
+    hint: Hint,
+    conf: BeartypeConf,
+    make_code_check: Callable[..., CodeGenerated],
+    exception_prefix: str,
+) -> CallableRaiserOrTester:
+    '''
+    **Type-checking function factory** (i.e., low-level callable dynamically
+    generating a pure-Python tester function testing whether an arbitrary object
+    passed to that tester satisfies the type hint passed to this factory)
+    *without* memoizing calls passed unhashable type hints.
+
+    This factory is intentionally *not* memoized (e.g., by the
+    ``@callable_cached`` decorator), as this factory is only called by the
+    higher-level :func:`._make_func_checker` factory.
+
+    See Also
+    --------
+    :func:`._make_func_checker`
+        Further details.
+    '''
+
     # Attempt to...
     #
     # Note that the passed "exception_prefix" is intentionally *NOT* passed to
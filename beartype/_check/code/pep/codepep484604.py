@@ -19,31 +19,36 @@ from beartype._check.metadata.hint.hintsmeta import HintsMeta
 from beartype._check.convert.convsanify import (
     sanify_hint_child)
 from beartype._check.metadata.metasane import (
-    HintOrHintSanifiedData,
     HintSanifiedData,
     ListHintOrHintSanifiedData,
-    SetHintOrHintSanifiedData,
-    get_hint_or_sane_hint,
+    TupleHintOrHintSanifiedData,
 )
+from beartype._conf.confcls import BeartypeConf
 from beartype._data.code.datacodemagic import LINE_RSTRIP_INDEX_OR
 from beartype._data.code.pep.datacodepep484604 import (
     CODE_PEP484604_UNION_CHILD_PEP_format,
     CODE_PEP484604_UNION_CHILD_NONPEP_format,
     CODE_PEP484604_UNION_PREFIX,
-    CODE_PEP484604_UNION_SUFFIX,
+    CODE_PEP484604_UNION_SUFFIX_format,
 )
-from beartype._data.hint.datahinttyping import SetTypes
-from beartype._data.hint.pep.sign.datapepsignset import HINT_SIGNS_UNION
-from beartype._util.cache.utilcachecall import callable_cached
-from beartype._util.cache.pool.utilcachepoolobjecttyped import (
-    acquire_object_typed,
-    release_object_typed,
+from beartype._data.hint.datahintpep import (
+    Hint,
+    TypeVarToHint,
+)
+from beartype._data.hint.datahinttyping import (
+    ListTypes,
+    TupleTypes,
+    TypeStack,
 )
+from beartype._data.hint.pep.sign.datapepsigns import (
+    HintSignOptional,
+    HintSignUnion,
+)
+from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.hint.pep.utilpepget import (
     get_hint_pep_args,
     get_hint_pep_sign_or_none,
 )
-from beartype._util.hint.pep.utilpeptest import is_hint_pep
 
 # ....................{ FACTORIES                          }....................
 def make_hint_pep484604_check_expr(hints_meta: HintsMeta) -> None:
@@ -110,9 +115,20 @@ def make_hint_pep484604_check_expr(hints_meta: HintsMeta) -> None:
         f'{repr(hints_meta)} not "HintsMeta" object.')
 
     # ....................{ LOCALS                         }....................
-    # Flattened tuple of two or more child hints subscripting this parent union
-    # such that *ALL* nested child hints subscripting child unions are expanded
-    # directly into this tuple, thus non-destructively eliminating child unions.
+    # 2-tuple "(hint_or_sane_childs_pep, hint_childs_nonpep)" of the two or more
+    # child hints subscripting this parent union flattened such that *ALL*
+    # nested child hints subscripting child unions are expanded directly into
+    # these tuples (thus non-destructively eliminating child unions) *AND*
+    # partitioned into (in order):
+    # * "hint_or_sane_childs_pep", the tuple of all PEP-compliant child hints
+    #   subscripting this union.
+    # * "hint_childs_nonpep", the tuple of all PEP-noncompliant child hints
+    #   subscripting this union.
+    #
+    # Since these child hints require fundamentally different forms of
+    # type-checking, prefiltering child hints into these tuples *BEFORE*
+    # generating code type-checking these child hints improves both efficiency
+    # and maintainability.
     #
     # Note that this getter is memoized and thus requires:
     # * Positional parameters.
@@ -120,79 +136,39 @@ def make_hint_pep484604_check_expr(hints_meta: HintsMeta) -> None:
     #   "hint_meta" object in entirety. Why? Memoization, of course. Passing the
     #   "hint_meta" object in entirety would effectively inhibit the memoization
     #   of this getter, which entirely defeats the point.
-    hint_or_sane_childs = _get_hint_pep484604_union_args_flattened(hints_meta)
-
-    # Reuse previously created sets of the following (when available):
-    # * "hint_childs_nonpep", the set of all PEP-noncompliant child hints
-    #   subscripting this union.
-    # * "hint_or_sane_childs_pep", the set of all PEP-compliant child hints subscripting
-    #   this union.
+    hint_or_sane_childs_pep, hint_childs_nonpep = (
+        _get_hint_pep484604_union_args_flattened(
+            hints_meta.hint_curr_meta.hint,
+            hints_meta.conf,
+            hints_meta.cls_stack,
+            hints_meta.hint_curr_meta.typevar_to_hint,
+            hints_meta.exception_prefix,
+        ))
+
+    # List of all code fragments type-checking the current pith against these
+    # arguments, initialized to the substring prefixing all such code.
     #
-    # Since these child hints require fundamentally different forms of
-    # type-checking, prefiltering child hints into these sets *BEFORE*
-    # generating code type-checking these child hints improves both efficiency
-    # and maintainability.
-    hint_childs_nonpep: SetTypes = (
-        acquire_object_typed(set))
-    hint_or_sane_childs_pep: SetHintOrHintSanifiedData = (
-        acquire_object_typed(set))
-
-    # Clear these sets prior to use below.
-    hint_childs_nonpep.clear()
-    hint_or_sane_childs_pep.clear()
-
-    # ....................{ FILTER                         }....................
-    #FIXME: Optimize by refactoring into a "while" loop. Naturally, profile that
-    #doing so actually *IS* an optimization before doing so. *sigh*
-
-    # For each child hint subscripting this union...
-    for hint_or_sane_child in hint_or_sane_childs:
-        #FIXME: Uncomment as desired for debugging. This test is currently a bit
-        #too costly to warrant uncommenting.
-        # Assert that this child hint is *NOT* shallowly ignorable. Why? Because
-        # any union containing one or more shallowly ignorable child hints is
-        # deeply ignorable and should thus have already been ignored after a
-        # call to the is_hint_ignorable() tester passed this union on handling
-        # the parent hint of this union.
-        # assert (
-        #     repr(hint_curr) not in HINTS_REPR_IGNORABLE_SHALLOW), (
-        #     f'{hint_curr_exception_prefix} {repr(hint_curr)} child '
-        #     f'{repr(hint_child)} ignorable but not ignored.')
-
-        # Child hint encapsulated by this metadata.
-        hint_child = get_hint_or_sane_hint(hint_or_sane_child)
+    # Note that these fragments are intentionally accumulated into a list
+    # subsequently joined exactly once rather than repeatedly concatenated
+    # onto the "hints_meta.func_curr_code" string. Since Python strings are
+    # immutable, each such concatenation would copy all prior code and thus
+    # scale quadratically with the number of child hints.
+    func_curr_code_frags = [CODE_PEP484604_UNION_PREFIX]
 
-        # If this child hint is PEP-compliant...
-        if is_hint_pep(hint_child):
-            # Filter this child hint *AND* all associated metadata (if any) into
-            # this set of PEP-compliant child hints.
-            #
-            # Note that this PEP-compliant child hint *CANNOT* also be filtered
-            # into the set of PEP-noncompliant child hints, even if this child
-            # hint originates from a non-"typing" type (e.g., "List[int]" from
-            # "list"). Why? Because that would then induce false positives when
-            # the current pith shallowly satisfies this non-"typing" type but
-            # does *NOT* deeply satisfy this child hint.
-            hint_or_sane_childs_pep.add(hint_or_sane_child)
-        # Else, this child hint is PEP-noncompliant. In this case...
-        else:
-            # Filter this child hint into this set of PEP-noncompliant child
-            # hints. Since PEP-noncompliant hints are by definition associated
-            # with *NO* meaningful metadata, silently ignore this metadata.
-            hint_childs_nonpep.add(hint_child)  # pyright: ignore
+    # Indentation preceding code type-checking this union, interpolated into
+    # each code fragment as that fragment is formatted.
+    indent_curr = hints_meta.indent_curr
 
     # ....................{ NON-PEP                        }....................
-    # Initialize the code type-checking the current pith against these arguments
-    # to the substring prefixing all such code.
-    hints_meta.func_curr_code = CODE_PEP484604_UNION_PREFIX
 
     # If this union is subscripted by one or more PEP-noncompliant child hints,
     # generate and append efficient code type-checking these child hints
     # *BEFORE* less efficient code type-checking any PEP-compliant child hints
     # subscripting this union.
     if hint_childs_nonpep:
-        hints_meta.func_curr_code += (
+        func_curr_code_frags.append(
             CODE_PEP484604_UNION_CHILD_NONPEP_format(
+                indent_curr=indent_curr,
                 # Python expression yielding the value of the current pith.
                 # Specifically...
                 pith_curr_expr=(
@@ -213,105 +189,120 @@ def make_hint_pep484604_check_expr(hints_meta: HintsMeta) -> None:
                 ),
                 # Python expression evaluating to a tuple of these arguments.
                 #
-                # Note that we would ideally avoid coercing this set into a
-                # tuple when this set only contains one type by passing that
-                # type directly to the _add_func_wrapper_local_type() function.
-                # Sadly, the "set" class defines no convenient or efficient
-                # means of retrieving the only item of a 1-set. Indeed, the most
-                # efficient means of doing so is to iterate over that set and
-                # immediately halt iteration:
-                #     for first_item in muh_set: break
-                #
-                # While we *COULD* technically leverage that approach here,
-                # doing so would also mandate adding multiple intermediate
-                # tests, mitigating any performance gains. Ultimately, we avoid
-                # doing so by falling back to the usual approach. See also this
-                # relevant self-StackOverflow post:
-                #       https://stackoverflow.com/a/40054478/2809027
+                # Note that this method deduplicates tuples *NOT* guaranteed to
+                # be duplicate-free. Any duplicate types in this tuple are
+                # silently ignored.
                 hint_curr_expr=hints_meta.add_func_scope_type_or_types(
                     hint_childs_nonpep),
             ))
 
     # ....................{ PEP                            }....................
-    # For the 0-based index of each PEP-compliant child hint of this union *AND*
-    # that hint...
-    for hint_or_sane_child_pep_index, hint_or_sane_child_pep in enumerate(
-        hint_or_sane_childs_pep):
-        # Code deeply type-checking this child hint.
-        hints_meta.func_curr_code += CODE_PEP484604_UNION_CHILD_PEP_format(
-            # Expression yielding the value of this pith.
-            hint_child_placeholder=hints_meta.enqueue_hint_or_sane_child(
-                hint_or_sane=hint_or_sane_child_pep,
-                indent_level=hints_meta.indent_level_child,
-                pith_expr=(
-                    # If either...
-                    #
-                    # Then prefer the expression efficiently reusing the value
-                    # previously assigned to a local variable by either the
-                    # above conditional or prior iteration of the current
-                    # conditional.
-                    hints_meta.pith_curr_var_name
-                    if (
-                        # This union is also subscripted by one or more
-                        # PEP-noncompliant child hints *OR*...
-                        hint_childs_nonpep or
-                        # This is any PEP-compliant child hint *EXCEPT* the
-                        # first...
-                        hint_or_sane_child_pep_index
-                    ) else
-                    # Then this union is not subscripted by any PEP-noncompliant
-                    # child hints *AND* this is the first PEP-compliant child
-                    # hint. In this case, preface this code with an expression
-                    # assigning this value to a local variable efficiently
-                    # reused by code generated by subsequent iteration.
-                    #
-                    # Note this child hint is guaranteed to be followed by at
-                    # least one more child hint. Why? Because the "typing"
-                    # module forces unions to be subscripted by two or more
-                    # child hints. By deduction, those child hints *MUST* be
-                    # PEP-compliant. Ergo, we need *NOT* explicitly validate
-                    # that constraint here.
-                    hints_meta.pith_curr_assign_expr
-                ),
-                pith_var_name_index=hints_meta.pith_curr_var_name_index,
-            ),
+    # If this union is subscripted by one or more PEP-compliant child hints,
+    # generate and append code deeply type-checking these child hints. Since
+    # unions subscripted by only PEP-noncompliant child hints (e.g.,
+    # "int | str") are both common *AND* fully type-checked by the single
+    # isinstance() call generated above, this test avoids needlessly
+    # localizing queue attributes for those unions.
+    if hint_or_sane_childs_pep:
+        # Localize attributes of this queue accessed in the loop below for
+        # efficiency. None of these attributes are modified by the
+        # HintsMeta.enqueue_hint_or_sane_child() method called in that loop.
+        enqueue_hint_or_sane_child = hints_meta.enqueue_hint_or_sane_child
+        indent_level_child = hints_meta.indent_level_child
+        pith_curr_assign_expr = hints_meta.pith_curr_assign_expr
+        pith_curr_var_name = hints_meta.pith_curr_var_name
+        pith_curr_var_name_index = hints_meta.pith_curr_var_name_index
+
+        # Python expression yielding the value of the current pith for the
+        # first PEP-compliant child hint of this union, defined as either...
+        pith_child_expr = (
+            # If this union is also subscripted by one or more
+            # PEP-noncompliant child hints, the expression efficiently reusing
+            # the value previously assigned to a local variable by the above
+            # conditional.
+            pith_curr_var_name
+            if hint_childs_nonpep else
+            # Else, this union is not subscripted by any PEP-noncompliant
+            # child hints. In this case, the expression assigning this value to
+            # a local variable efficiently reused by code generated by
+            # subsequent iteration.
+            #
+            # Note this child hint is guaranteed to be followed by at least one
+            # more child hint. Why? Because the "typing" module forces unions
+            # to be subscripted by two or more child hints. By deduction, those
+            # child hints *MUST* be PEP-compliant. Ergo, we need *NOT*
+            # explicitly validate that constraint here.
+            pith_curr_assign_expr
         )
 
+        # For each PEP-compliant child hint of this union...
+        for hint_or_sane_child_pep in hint_or_sane_childs_pep:
+            # Code deeply type-checking this child hint.
+            func_curr_code_frags.append(
+                CODE_PEP484604_UNION_CHILD_PEP_format(
+                    indent_curr=indent_curr,
+                    # Expression yielding the value of this pith.
+                    hint_child_placeholder=enqueue_hint_or_sane_child(
+                        hint_or_sane=hint_or_sane_child_pep,
+                        indent_level=indent_level_child,
+                        pith_expr=pith_child_expr,
+                        pith_var_name_index=pith_curr_var_name_index,
+                    ),
+                ))
+
+            # Prefer the expression efficiently reusing the value previously
+            # assigned to a local variable by either the above conditional or
+            # the first iteration of this loop for all subsequent child hints.
+            # Since unconditionally rebinding this local is cheaper than testing
+            # whether this is the first iteration, this is (mostly) a noop.
+            pith_child_expr = pith_curr_var_name
+
     # ....................{ RETURN                         }....................
-    # Release this pair of sets back to their respective pools.
-    release_object_typed(hint_childs_nonpep)
-    release_object_typed(hint_or_sane_childs_pep)
-
-    # If this code is *NOT* its initial value, this union is subscripted by one
-    # or more unignorable child hints and the above logic generated code
-    # type-checking these child hints. In this case...
-    if hints_meta.func_curr_code is not CODE_PEP484604_UNION_PREFIX:
-        # Munge this code to...
-        hints_meta.func_curr_code = (
-            # Strip the erroneous " or" suffix appended by the last child hint
-            # from this code.
-            f'{hints_meta.func_curr_code[:LINE_RSTRIP_INDEX_OR]}'
-            # Suffix this code by the substring suffixing all such code.
-            f'{CODE_PEP484604_UNION_SUFFIX}'
-        # Format the "indent_curr" prefix into this code, deferred above for
-        # efficiency.
-        ).format(indent_curr=hints_meta.indent_curr)
-    # Else, this snippet is its initial value and thus ignorable.
+    # If one or more code fragments were appended to the initial prefix, this
+    # union is subscripted by one or more unignorable child hints and the above
+    # logic generated code type-checking these child hints. In this case...
+    if len(func_curr_code_frags) > 1:
+        # Strip the erroneous " or" suffix appended by the last child hint from
+        # the last code fragment *BEFORE* joining these fragments, avoiding the
+        # need to subsequently slice (and thus copy) the joined code.
+        func_curr_code_frags[-1] = (
+            func_curr_code_frags[-1][:LINE_RSTRIP_INDEX_OR])
+
+        # Suffix this code by the substring suffixing all such code.
+        func_curr_code_frags.append(CODE_PEP484604_UNION_SUFFIX_format(
+            indent_curr=indent_curr))
+
+        # Join these fragments into this code.
+        hints_meta.func_curr_code = ''.join(func_curr_code_frags)
+    # Else, no code fragments were appended and this union is thus ignorable.
+    # In this case, preserve the initial prefix as the code for this union.
+    else:
+        hints_meta.func_curr_code = CODE_PEP484604_UNION_PREFIX
 
 # ....................{ PRIVATE ~ getters                  }....................
 @callable_cached
 def _get_hint_pep484604_union_args_flattened(
-    hints_meta: HintsMeta) -> Tuple[HintOrHintSanifiedData, ...]:
+    hint: Hint,
+    conf: BeartypeConf,
+    cls_stack: TypeStack,
+    typevar_to_hint: TypeVarToHint,
+    exception_prefix: str,
+) -> Tuple[TupleHintOrHintSanifiedData, TupleTypes]:
     '''
-    Flattened tuple of the two or more child hints subscripting the passed
-    :pep:`604`- or :pep:`484`-compliant union hint such that *all* nested child
-    hints subscripting *all* child union hints are **flattened** (i.e., expanded
-    directly) into the returned tuple, thus non-destructively eliminating *all*
-    child union hints of this parent union hint.
-
-    This getter is intentionally *not* memoized (e.g., by the
-    :func:`.callable_cached` decorator), as the only function calling this
-    getter *is* itself memoized.
+    2-tuple ``(hint_or_sane_childs_pep, hint_childs_nonpep)`` of the two or more
+    child hints subscripting the passed :pep:`604`- or :pep:`484`-compliant
+    union hint such that *all* nested child hints subscripting *all* child
+    union hints are **flattened** (i.e., expanded directly) into these tuples
+    (thus non-destructively eliminating *all* child union hints of this parent
+    union hint) *and* partitioned into PEP-compliant and -noncompliant child
+    hints.
+
+    This getter is memoized for efficiency. Since the high-level
+    :class:`.HintsMeta` queue describing the ongoing breadth-first search (BFS)
+    is both mutable and unhashable, this getter instead accepts only the
+    low-level hashable metadata relevant to flattening this union. Doing so
+    enables the same union (e.g., ``int | str | None``) annotating multiple
+    callables to be flattened only once.
 
     Caveats
     -------
@@ -321,31 +312,46 @@ def _get_hint_pep484604_union_args_flattened(
 
     Parameters
     ----------
-    hints_meta : HintsMeta
-        **Type hint type-checking metadata queue** (i.e., low-level fixed list
-        of metadata describing all visitable type hints currently discovered by
-        the breadth-first search (BFS) dynamically generating pure-Python
-        type-checking code snippets in the
-        :func:`beartype._check.code.codemake.make_check_expr` factory).
+    hint : Hint
+        Union hint to be flattened.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object).
+    cls_stack : TypeStack
+        **Type stack** (i.e., either a tuple of the one or more
+        :func:`beartype.beartype`-decorated classes lexically containing the
+        class variable or method annotated by this hint *or* :data:`None`).
+    typevar_to_hint : TypeVarToHint
+        **Type variable lookup table** (i.e., immutable dictionary mapping from
+        the :pep:`484`-compliant **type variables** (i.e.,
+        :class:`typing.TypeVar` objects) originally parametrizing the origins
+        of all transitive parent hints of this hint to the corresponding child
+        hints subscripting these parent hints).
+    exception_prefix : str
+        Human-readable substring prefixing the representation of this object in
+        the exception message.
 
     Returns
     -------
-    Tuple[HintOrHintSanifiedData, ...]
-        Flattened tuple of the two or more child hints *or* **sanified child
-        hint metadatum** (i.e., :class:`.HintSanifiedData` objects) subscripting
-        this parent union hint.
+    Tuple[TupleHintOrHintSanifiedData, TupleTypes]
+        2-tuple ``(hint_or_sane_childs_pep, hint_childs_nonpep)``, where:
+
+        * ``hint_or_sane_childs_pep`` is the flattened tuple of all
+          PEP-compliant child hints *or* **sanified child hint metadatum**
+          (i.e., :class:`.HintSanifiedData` objects) subscripting this parent
+          union hint.
+        * ``hint_childs_nonpep`` is the flattened tuple of all
+          PEP-noncompliant child hints (i.e., types) subscripting this parent
+          union hint. Since PEP-noncompliant hints are by definition associated
+          with *no* meaningful metadata, this metadata is silently ignored.
 
     Raises
     ------
     BeartypeDecorHintPep604Exception
         If this tuple is empty.
     '''
-    print(f'[484/604] hint_curr_meta: {repr(hints_meta.hint_curr_meta)}')
 
     # ....................{ LOCALS                         }....................
-    # This union type hint.
-    hint = hints_meta.hint_curr_meta.hint
-
     # Tuple of all child hints subscripting this union if any *OR* the empty
     # tuple otherwise (e.g., if this union is its own unsubscripted
     # "typing.Optional" or "typing.Union" factory).
@@ -363,8 +369,7 @@ def _get_hint_pep484604_union_args_flattened(
     #       >>> typing.Union[()]
     #       TypeError: Cannot take a Union of no types.
     assert hint_childs, (
-        f'{hints_meta.exception_prefix}'
-        f'union type hint {repr(hint)} unsubscripted.')
+        f'{exception_prefix}union type hint {repr(hint)} unsubscripted.')
     # Else, this union is subscripted by two or more arguments. Why two rather
     # than one? Because the "typing" module reduces unions of one argument to
     # that argument: e.g.,
@@ -372,35 +377,34 @@ def _get_hint_pep484604_union_args_flattened(
     #     >>> typing.Union[int]
     #     int
 
-    # 0-based index of the currently iterated child hint.
-    hint_childs_index = 0
-
-    # Number of these child hints.
-    hint_childs_len = len(hint_childs)
-
-    # For efficiency, reuse a previously created list of all new child hints of
-    # this parent union.
-    hint_or_sane_childs_new: ListHintOrHintSanifiedData = (
-        acquire_object_typed(list))
-    hint_or_sane_childs_new.clear()
+    # Lists of all new PEP-compliant and -noncompliant child hints
+    # (respectively) of this parent union.
+    #
+    # Note that these lists are intentionally *NOT* acquired from the object
+    # pool. Since this getter is memoized *AND* unions are typically subscripted
+    # by only a handful of child hints, creating new small lists is faster than
+    # acquiring and releasing pooled lists. Doing so also avoids leaking pooled
+    # lists when sanifying a child hint raises an exception.
+    hint_or_sane_childs_pep: ListHintOrHintSanifiedData = []
+    hint_childs_nonpep: ListTypes = []
 
     # ....................{ SEARCH                         }....................
     # For each subscripted argument of this union...
     #
-    # Note that this preliminary iteration:
-    # * Modifies the "hint_childs" container being iterated over and is thus
-    #   intentionally implemented as a cumbersome "while" loop rather than a
-    #   convenient "for" loop.
-    # * Exists for the sole purpose of explicitly flattening *ALL* child unions
-    #   nested in this parent union. This iteration *CANNOT* be efficiently
-    #   combined with the iteration performed below for that reason.
+    # Note that this iteration:
+    # * Does *NOT* modify the "hint_childs" container being iterated over and is
+    #   thus implemented as a C-driven "for" loop rather than an index-driven
+    #   "while" loop. Child hints of nested child unions are instead expanded
+    #   directly into the lists accumulated below.
+    # * Explicitly flattens *ALL* child unions nested in this parent union while
+    #   also partitioning child hints into PEP-compliant and -noncompliant child
+    #   hints. Since the sign of each child hint is required to detect child
+    #   unions, partitioning child hints here avoids a subsequent iteration
+    #   redundantly recomputing these signs.
     # * Does *NOT* recursively flatten arbitrarily nested child unions
     #   regardless of nesting depth in this parent union. Doing so is
     #   non-trivial and currently *NOT* required by any existing edge cases.
-    while hint_childs_index < hint_childs_len:
-        # Current child hint of this union.
-        hint_child = hint_childs[hint_childs_index]
-
+    for hint_child in hint_childs:
         # Sane child hint sanified from this possibly insane child hint if
         # sanifying this child hint did not generate supplementary metadata *OR*
         # that metadata otherwise (i.e., if sanifying this child hint generated
@@ -415,23 +419,39 @@ def _get_hint_pep484604_union_args_flattened(
         #   expanded to the PEP 484-compliant "float | int" and "complex | float
         #   | int" type hints (respectively) when the non-default
         #   "conf.is_pep484_tower=True" parameter is enabled.
-        # print(f'Sanifying union child hint {repr(hint_child)} under {repr(conf)}...')
         hint_or_sane_child = sanify_hint_child(
             hint=hint_child,
-            conf=hints_meta.conf,
-            cls_stack=hints_meta.cls_stack,
-            typevar_to_hint=hints_meta.hint_curr_meta.typevar_to_hint,
-            exception_prefix=hints_meta.exception_prefix,
+            conf=conf,
+            cls_stack=cls_stack,
+            typevar_to_hint=typevar_to_hint,
+            exception_prefix=exception_prefix,
         )
-        # print(f'Sanified union child hint to {repr(hint_or_sane_child)}.')
+
+        # True only if sanifying this child hint generated supplementary
+        # metadata encapsulating this child hint.
+        is_hint_child_sane = isinstance(hint_or_sane_child, HintSanifiedData)
 
         # Child hint encapsulated by this metadata.
-        hint_child = get_hint_or_sane_hint(hint_or_sane_child)
+        #
+        # Note that this is an inlined variant of the get_hint_or_sane_hint()
+        # getter, avoiding the cost of a function call for each child hint *AND*
+        # preserving the above boolean for reuse below.
+        hint_child = (
+            hint_or_sane_child.hint  # pyright: ignore
+            if is_hint_child_sane else
+            hint_or_sane_child
+        )
 
         # Sign of this sanified child hint if this hint is PEP-compliant *OR*
         # "None" otherwise (i.e., if this hint is PEP-noncompliant).
         hint_child_sign = get_hint_pep_sign_or_none(hint_child)
 
+        # If this child hint is PEP-noncompliant, filter this child hint into
+        # the list of PEP-noncompliant child hints.
+        if hint_child_sign is None:
+            hint_childs_nonpep.append(hint_child)  # pyright: ignore
+        # Else, this child hint is PEP-compliant.
+        #
         # If this child hint is itself a child union nested in this parent
         # union, explicitly flatten this nested union by appending *ALL* child
         # child hints subscripting this child union onto this parent union.
@@ -445,46 +465,120 @@ def _get_hint_pep484604_union_args_flattened(
         #     >>> from typing import Union
         #     >>> Union[float, Union[int, str]]
         #     typing.Union[float, int, str]
-        if hint_child_sign in HINT_SIGNS_UNION:
-            # Tuple of all child child hints subscripting this child union.
-            hint_child_childs = get_hint_pep_args(hint_child)
-            # print(f'Expanding union {repr(hint_curr)} with child union {repr(hint_child_childs)}...')
-
-            # If this hint is encapsulated by metadata...
-            if isinstance(hint_or_sane_child, HintSanifiedData):
-                # For each child child type subscripting this child union...
-                for hint_child_child in hint_child_childs:
-                    # Metadata encapsulating the sanification of this child
-                    # child hint.
-                    hint_or_sane_child_child = hint_or_sane_child.permute(
-                        hint=hint_child_child)
-
-                    # Inefficiently append this child child hint to this parent
-                    # union in a manner preserving this metadata.
-                    hint_or_sane_childs_new.append(hint_or_sane_child_child)
-            # Else, this is a bare hint *NOT* encapsulated by metadata. In this
-            # case...
-            else:
-                # Efficiently append these child child hints to this parent
-                # union while ignoring this non-existent metadata.
-                hint_or_sane_childs_new.extend(hint_child_childs)
-        # Else, this child hint is *NOT* itself a union. In this case, append
-        # this child hint to this parent union.
+        #
+        # Note that this test is intentionally implemented as two identity
+        # comparisons against the only two signs in the "HINT_SIGNS_UNION" set
+        # rather than as a set membership test, which would instead require
+        # hashing this sign for each child hint. If that set ever grows, this
+        # test *MUST* be generalized back to "in HINT_SIGNS_UNION".
+        elif (
+            hint_child_sign is HintSignUnion or
+            hint_child_sign is HintSignOptional
+        ):
+            # For each child child hint subscripting this child union...
+            for hint_child_child in get_hint_pep_args(hint_child):
+                # If this child child hint is PEP-noncompliant, filter this
+                # child child hint into the list of PEP-noncompliant child
+                # hints while ignoring any metadata encapsulating this child
+                # union.
+                if get_hint_pep_sign_or_none(hint_child_child) is None:
+                    hint_childs_nonpep.append(hint_child_child)
+                # Else, this child child hint is PEP-compliant. In this case...
+                #
+                # If this child union is encapsulated by metadata, append
+                # metadata encapsulating the sanification of this child child
+                # hint in a manner preserving this metadata.
+                elif is_hint_child_sane:
+                    hint_or_sane_childs_pep.append(hint_or_sane_child.permute(  # pyright: ignore
+                        hint=hint_child_child))
+                # Else, this child union is a bare hint *NOT* encapsulated by
+                # metadata. In this case, append this child child hint as is.
+                else:
+                    hint_or_sane_childs_pep.append(hint_child_child)
+        # Else, this PEP-compliant child hint is *NOT* itself a union. In this
+        # case, filter this child hint *AND* all associated metadata (if any)
+        # into the list of PEP-compliant child hints.
+        #
+        # Note that this PEP-compliant child hint *CANNOT* also be filtered into
+        # the list of PEP-noncompliant child hints, even if this child hint
+        # originates from a non-"typing" type (e.g., "List[int]" from "list").
+        # Why? Because that would then induce false positives when the current
+        # pith shallowly satisfies this non-"typing" type but does *NOT* deeply
+        # satisfy this child hint.
         else:
-            hint_or_sane_childs_new.append(hint_or_sane_child)
-            # print(f'Flattened union child {repr(hint_child)} to {repr(hint_or_sane_child)}...')
-
-        # Increment the 0-based index of the currently iterated child hint.
-        hint_childs_index += 1
+            hint_or_sane_childs_pep.append(hint_or_sane_child)
+
+    # ....................{ DEDUPLICATE                    }....................
+    # If this union is subscripted by two or more PEP-compliant child hints,
+    # deduplicate these child hints while preserving their original order. Why?
+    # Because sanifying and flattening child hints may produce duplicate child
+    # hints (e.g., when reducing two distinct child hints to the same hint),
+    # each of which would otherwise generate redundant code type-checking the
+    # same pith against the same hint. Order *MUST* be preserved, as the code
+    # generated for the first such hint differs from that of all subsequent
+    # hints.
+    #
+    # Note that:
+    # * PEP-noncompliant child hints need *NOT* be deduplicated here, as the
+    #   HintsMeta.add_func_scope_type_or_types() method subsequently passed
+    #   these hints already does so.
+    # * Hashable child hints are deduplicated by hashing in amortized O(1) time
+    #   per child hint. Unhashable child hints (e.g., "typing.Annotated[...]"
+    #   hints subscripted by unhashable metadata) are deduplicated by identity
+    #   instead. Child hints are intentionally *NEVER* compared with a linear
+    #   search, which would call the __eq__() dunder methods of arbitrary
+    #   user-defined objects with O(n**2) time complexity. Worse, __eq__()
+    #   methods returning non-boolean objects (e.g., elementwise comparisons
+    #   of NumPy arrays) raise exceptions when implicitly coerced into booleans.
+    if len(hint_or_sane_childs_pep) > 1:
+        # List of all unique PEP-compliant child hints of this parent union.
+        hint_or_sane_childs_pep_unique: ListHintOrHintSanifiedData = []
+
+        # Set of all hashable PEP-compliant child hints visited below.
+        hint_or_sane_childs_pep_hashable = set()
+
+        # Set of the object identifiers of all unhashable PEP-compliant child
+        # hints visited below.
+        hint_or_sane_childs_pep_unhashable_ids = set()
+
+        # For each PEP-compliant child hint of this union...
+        for hint_or_sane_child in hint_or_sane_childs_pep:
+            # Attempt to...
+            try:
+                # If this child hint is a duplicate of a previously visited
+                # hashable child hint, silently ignore this child hint.
+                if hint_or_sane_child in hint_or_sane_childs_pep_hashable:
+                    continue
+                # Else, this child hint is *NOT* such a duplicate.
+
+                # Record this child hint as visited.
+                hint_or_sane_childs_pep_hashable.add(hint_or_sane_child)
+            # If hashing or comparing this child hint raised an exception, this
+            # child hint is either unhashable *OR* defines a non-standard
+            # __eq__() dunder method. In either case, fallback to identity.
+            except Exception:
+                # Object identifier of this child hint.
+                hint_or_sane_child_id = id(hint_or_sane_child)
+
+                # If this child hint is a previously visited unhashable child
+                # hint, silently ignore this child hint.
+                if hint_or_sane_child_id in (
+                    hint_or_sane_childs_pep_unhashable_ids):
+                    continue
+                # Else, this child hint has yet to be visited.
+
+                # Record this child hint as visited.
+                hint_or_sane_childs_pep_unhashable_ids.add(
+                    hint_or_sane_child_id)
+
+            # Append this unique child hint to this list.
+            hint_or_sane_childs_pep_unique.append(hint_or_sane_child)
+
+        # Replace the prior list with this list.
+        hint_or_sane_childs_pep = hint_or_sane_childs_pep_unique
+    # Else, this union is subscripted by at most one PEP-compliant child hint,
+    # which is necessarily unique.
 
     # ....................{ RETURN                         }....................
-    # Freeze this temporary list back to this permanent tuple, replacing the
-    # prior unflattened contents of this tuple.
-    hint_or_sane_childs = tuple(hint_or_sane_childs_new)
-
-    # Release this list back to its respective pool.
-    release_object_typed(hint_or_sane_childs_new)
-    # print(f'Flattened union to {repr(hint_or_sane_childs)}...')
-
-    # Return this tuple and corresponding type variable lookup table.
-    return hint_or_sane_childs
+    # Return these lists frozen into tuples.
+    return tuple(hint_or_sane_childs_pep), tuple(hint_childs_nonpep)
@@ -25,7 +25,6 @@ from beartype._data.os.dataosshell import (
 )
 from beartype._util.error.utilerrwarn import issue_warning
 from beartype._util.os.utilosshell import get_shell_var_value_or_none
-from beartype._util.text.utiltextjoin import join_delimited_disjunction
 
 # ....................{ GETTERS                            }....................
 def get_is_color(is_color: BoolTristateUnpassable) -> BoolTristate:  # pyright: ignore
@@ -80,6 +79,13 @@ def get_is_color(is_color: BoolTristateUnpassable) -> BoolTristate:  # pyright:
         # If the string value of this environment variable is unrecognized...
         if (is_color_shell_var_value not in
             SHELL_VAR_CONF_IS_COLOR_VALUE_TO_OBJ):
+            # Defer error-handling imports. Since this branch is only entered
+            # on erroneously setting this environment variable, deferring this
+            # import avoids needlessly importing this submodule on the common
+            # case of importing beartype.
+            from beartype._util.text.utiltextjoin import (
+                join_delimited_disjunction)
+
             # Human-readable string listing the names of all valid string values
             # of this environment variable, double-quoting each such name for
             # additional readability.
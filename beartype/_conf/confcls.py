@@ -38,8 +38,10 @@ from beartype.roar._roarwarn import (
     _BeartypeConfReduceDecoratorExceptionToWarningDefault)
 from beartype.typing import (
     TYPE_CHECKING,
+    Callable,
     Dict,
     Optional,
+    Tuple,
 )
 from beartype._conf.confenum import (
     BeartypeDecorationPosition,
@@ -60,12 +62,14 @@ from beartype._data.hint.datahinttyping import (
     BoolTristateUnpassable,
     CollectionStrs,
     DictStrToAny,
+    MappingStrToAny,
     TypeException,
     TypeWarning,
 )
 from beartype._data.func.datafuncarg import ARG_VALUE_UNPASSED
 from beartype._util.utilobject import get_object_type_basename
 from threading import Lock
+from types import MappingProxyType
 
 # ....................{ DATACLASSES                        }....................
 class BeartypeConf(object):
@@ -726,6 +730,54 @@ class BeartypeConf(object):
               ``"False"``, nor ``"None"``).
         '''
 
+        # ..................{ CACHE                          }..................
+        # Validate and possibly override the "is_color" parameter by the value
+        # of the ${BEARTYPE_IS_COLOR} environment variable (if set).
+        is_color = get_is_color(is_color)
+
+        #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+        # CAUTION: Synchronize this tuple with the similar "self._conf_kwargs"
+        # dictionary defined below.
+        #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+        # Efficiently hashable tuple of these parameters in arbitrary order.
+        conf_args = (
+            claw_decoration_position_funcs,
+            claw_decoration_position_types,
+            claw_is_pep526,
+            claw_skip_package_names,
+            hint_overrides,
+            is_color,
+            is_debug,
+            is_pep484_tower,
+            strategy,
+            violation_door_type,
+            violation_param_type,
+            violation_return_type,
+            violation_type,
+            violation_verbosity,
+            warning_cls_on_decorator_exception,
+        )
+
+        # Configuration previously instantiated by this method with these
+        # parameters if any *OR* "None" otherwise.
+        #
+        # Note that this lookup is intentionally performed *OUTSIDE* the thread
+        # lock below. Since this method is called at most decoration sites *AND*
+        # almost always returns a previously instantiated configuration, this
+        # lock-free fast path avoids the cost of entering and exiting that lock
+        # in the common case. Since dictionary lookups are atomic under the
+        # GIL *AND* since configurations are only cached below *AFTER* being
+        # fully initialized, this lookup is thread-safe.
+        self =_beartype_conf_args_to_conf.get(conf_args)
+
+        # If this method has already instantiated a configuration with these
+        # parameters, return that configuration for consistency and efficiency.
+        if self is not None:
+            return self
+        # Else, this method has *NOT* yet instantiated a configuration with
+        # these parameters. In this case, continue to do so and then cache that
+        # configuration.
+
         # In a non-reentrant thread lock specific to beartype configurations...
         #
         # Note that this lock is potentially overkill and thus unnecessary.
@@ -735,65 +787,44 @@ class BeartypeConf(object):
         # cost of race conditions is high, this lock does no real-world harm and
         # may actually do a great deal of real-world good. Safety first, all!
         with _beartype_conf_lock:
-            # ..................{ CACHE                      }..................
-            # Validate and possibly override the "is_color" parameter by the
-            # value of the ${BEARTYPE_IS_COLOR} environment variable (if set).
-            is_color = get_is_color(is_color)
-
-            #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-            # CAUTION: Synchronize this tuple with the similar
-            # "self._conf_kwargs" dictionary defined below.
-            #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-            # Efficiently hashable tuple of these parameters in arbitrary order.
-            conf_args = (
-                claw_decoration_position_funcs,
-                claw_decoration_position_types,
-                claw_is_pep526,
-                claw_skip_package_names,
-                hint_overrides,
-                is_color,
-                is_debug,
-                is_pep484_tower,
-                strategy,
-                violation_door_type,
-                violation_param_type,
-                violation_return_type,
-                violation_type,
-                violation_verbosity,
-                warning_cls_on_decorator_exception,
-            )
-
-            # If this method has already instantiated a configuration with these
-            # parameters, return that configuration for consistency and
-            # efficiency.
+            # If another thread instantiated a configuration with these
+            # parameters between the above lock-free lookup and entering this
+            # lock, return that configuration for consistency.
             if conf_args in _beartype_conf_args_to_conf:
                 return _beartype_conf_args_to_conf[conf_args]
-            # Else, this method has *NOT* yet instantiated a configuration with
-            # these parameters. In this case, continue to do so and then cache
-            # that configuration.
+            # Else, no thread has instantiated a configuration with these
+            # parameters. In this case, this thread is now the only thread
+            # instantiating such a configuration.
 
             # Dictionary mapping from the names to values of *ALL* possible
             # keyword parameters configuring this configuration, intentionally
             # defined *AFTER* this method first attempts to efficiently reduce
             # to a noop by returning a previously instantiated configuration.
-            conf_kwargs = dict(
-                claw_decoration_position_funcs=claw_decoration_position_funcs,
-                claw_decoration_position_types=claw_decoration_position_types,
-                claw_is_pep526=claw_is_pep526,
-                claw_skip_package_names=claw_skip_package_names,
-                hint_overrides=hint_overrides,
-                is_color=is_color,
-                is_debug=is_debug,
-                is_pep484_tower=is_pep484_tower,
-                strategy=strategy,
-                violation_door_type=violation_door_type,
-                violation_param_type=violation_param_type,
-                violation_return_type=violation_return_type,
-                violation_type=violation_type,
-                violation_verbosity=violation_verbosity,
-                warning_cls_on_decorator_exception=(
+            #
+            # Note that this dictionary is intentionally defined as a literal
+            # rather than by calling the dict() constructor. CPython compiles
+            # the former to a single opcode preallocating a dictionary of the
+            # exact size required *WITHOUT* parsing keyword arguments.
+            conf_kwargs = {
+                'claw_decoration_position_funcs': (
+                    claw_decoration_position_funcs),
+                'claw_decoration_position_types': (
+                    claw_decoration_position_types),
+                'claw_is_pep526': claw_is_pep526,
+                'claw_skip_package_names': claw_skip_package_names,
+                'hint_overrides': hint_overrides,
+                'is_color': is_color,
+                'is_debug': is_debug,
+                'is_pep484_tower': is_pep484_tower,
+                'strategy': strategy,
+                'violation_door_type': violation_door_type,
+                'violation_param_type': violation_param_type,
+                'violation_return_type': violation_return_type,
+                'violation_type': violation_type,
+                'violation_verbosity': violation_verbosity,
+                'warning_cls_on_decorator_exception': (
                     warning_cls_on_decorator_exception),
-            )
+            }
 
             # Default all parameters not explicitly passed by the user to sane
             # defaults *BEFORE* validating these parameters.
@@ -830,17 +861,16 @@ class BeartypeConf(object):
             # Store data structures encapsulating these passed parameters for
             # subsequent reuse *BEFORE* possibly modifying the values of these
             # parameters below.
+            #
+            # Note that this dictionary is intentionally stored as is rather
+            # than as a read-only proxy wrapping this dictionary. Whereas
+            # dictionaries are trivially copyable and picklable, proxies are
+            # neither. The public "kwargs" property instead wraps this
+            # dictionary in a read-only proxy on each access, preventing callers
+            # from accidentally corrupting this cached configuration.
             self._conf_args = conf_args
             self._conf_kwargs = conf_kwargs
 
-            # Assert that these two data structures encapsulate the same number
-            # of configuration parameters (as a feeble safety check).
-            assert len(self._conf_args) == len(self._conf_kwargs)
-
-            # Cache this configuration with all relevant dictionary singletons
-            # *BEFORE* possibly modifying the values of passed parameters below.
-            _beartype_conf_args_to_conf[conf_args] = self
-
             # ..................{ CLASSIFY                   }..................
             # Classify all passed parameters that have now been possibly
             # modified above with this configuration.
@@ -909,6 +939,16 @@ class BeartypeConf(object):
             self._warning_cls_on_decorator_exception = (
                 warning_cls_on_decorator_exception)
 
+            # ..................{ CACHE                      }..................
+            # Cache this configuration with all relevant dictionary singletons
+            # *AFTER* fully initializing all instance variables above. Since
+            # the lock-free lookup at the head of this method returns cached
+            # configurations to other threads *WITHOUT* acquiring this lock,
+            # publication *MUST* come last. Caching this configuration any
+            # earlier would expose a partially initialized configuration to
+            # those threads.
+            _beartype_conf_args_to_conf[conf_args] = self
+
         # Return this configuration.
         return self
 
@@ -918,9 +958,9 @@ class BeartypeConf(object):
 
     #FIXME: Publicly document this in our reST-formatted docos, please.
     @property
-    def kwargs(self) -> DictStrToAny:
+    def kwargs(self) -> MappingStrToAny:
         '''
-        **Beartype configuration keyword dictionary** (i.e., dictionary mapping
+        **Beartype configuration keyword mapping** (i.e., read-only mapping
         from the names of all keyword parameters accepted by the :meth:`__new__`
         method to the corresponding values of those parameters in this
         configuration).
@@ -943,10 +983,11 @@ class BeartypeConf(object):
 
         Caveats
         -------
-        **Avoid modifying this dictionary directly.** Instead, only modify
-        shallow copies of this dictionary as in the above example. If this
-        dictionary is directly modified, this beartype configuration *will*
-        behave erratically, erroneously, and non-deterministically.
+        **This mapping is read-only.** Attempting to modify this mapping
+        directly raises a :exc:`TypeError`. Instead, only modify shallow copies
+        of this mapping as in the above example. Since this mapping is a
+        :class:`types.MappingProxyType` object, the ``copy()`` method of this
+        mapping returns a new mutable dictionary.
 
         See Also
         --------
@@ -954,7 +995,7 @@ class BeartypeConf(object):
             Further details.
         '''
 
-        return self._conf_kwargs
+        return MappingProxyType(self._conf_kwargs)
 
     # ..................{ PROPERTIES ~ options               }..................
     # Read-only public properties with which this configuration was originally
@@ -1264,11 +1305,26 @@ class BeartypeConf(object):
             Further details.
         '''
 
+        # If this other object is this configuration, these objects are equal.
+        #
+        # Note that this is the common case. Since beartype configurations are
+        # self-caching singletons, equal configurations are almost always the
+        # same object.
+        if self is other:
+            return True
+        # Else, this other object is *NOT* this configuration.
+
         # Return either...
         return (
             # If this other object is also a beartype configuration, true only
-            # if these configurations share the same settings;
-            self._conf_args == other._conf_args
+            # if these configurations share the same settings. Since comparing
+            # precomputed hashes is substantially faster than comparing tuples
+            # of settings, the former efficiently rejects most unequal
+            # configurations *BEFORE* the latter is performed;
+            (
+                self._hash == other._hash and
+                self._conf_args == other._conf_args
+            )
             if isinstance(other, BeartypeConf) else
             # Else, this other object is *NOT* also a beartype configuration. In
             # this case, the standard singleton informing Python that this
@@ -1292,6 +1348,46 @@ class BeartypeConf(object):
         return self._hash
 
 
+    def __reduce__(self) -> Tuple[Callable[..., 'BeartypeConf'], tuple]:
+        '''
+        **Beartype configuration reducer** (i.e., 2-tuple instructing the
+        :mod:`pickle` and :mod:`copy` modules how to reinstantiate this
+        configuration), enabling configurations to be safely pickled and
+        copied.
+
+        Since configurations are self-caching singletons, this reducer
+        reinstantiates this configuration by passing the keyword parameters
+        originally configuring this configuration to the :meth:`__new__`
+        method, which then returns the previously cached configuration with
+        those parameters if any. This reducer intentionally returns *no*
+        pickling state. Restoring the instance variables of this configuration
+        from pickled state would instead overwrite the instance variables of a
+        previously cached configuration shared with the rest of the active
+        Python interpreter.
+
+        Returns
+        -------
+        Tuple[Callable[..., BeartypeConf], tuple]
+            2-tuple ``(func, args)`` such that calling ``func(*args)``
+            reinstantiates this configuration.
+        '''
+
+        # Dictionary mapping from the names to the originally passed values of
+        # *ALL* keyword parameters configuring this configuration.
+        #
+        # Note that the "_conf_kwargs" dictionary *CANNOT* be passed as is.
+        # Whereas the "_conf_args" tuple preserves the originally passed values
+        # of these parameters, the __new__() method replaces the values of
+        # unpassed parameters in that dictionary with sane defaults. Since
+        # that tuple and dictionary list these parameters in the same order,
+        # zipping the keys of the latter with the items of the former suffices.
+        conf_kwargs = dict(zip(self._conf_kwargs, self._conf_args))
+
+        # Return a 2-tuple reinstantiating this configuration from these
+        # parameters.
+        return (_make_beartype_conf, (conf_kwargs,))
+
+
     def __repr__(self) -> str:
         '''
         **Beartype configuration representation** (i.e., machine-readable
@@ -1348,6 +1444,31 @@ class BeartypeConf(object):
         # Return the machine-readable representation of this configuration.
         return self._repr
 
+# ....................{ PRIVATE ~ factories                }....................
+def _make_beartype_conf(conf_kwargs: DictStrToAny) -> BeartypeConf:
+    '''
+    Beartype configuration configured by the passed keyword parameters.
+
+    This factory is an unpickling helper called by the
+    :meth:`BeartypeConf.__reduce__` method. Since the
+    :meth:`BeartypeConf.__new__` method accepts *only* keyword parameters, the
+    :mod:`pickle` and :mod:`copy` modules cannot directly call that method.
+
+    Parameters
+    ----------
+    conf_kwargs : Dict[str, object]
+        Dictionary mapping from the names to values of *all* possible keyword
+        parameters configuring this configuration.
+
+    Returns
+    -------
+    BeartypeConf
+        Beartype configuration configured by these parameters.
+    '''
+
+    # Return the beartype configuration configured by these parameters.
+    return BeartypeConf(**conf_kwargs)
+
 # ....................{ PRIVATE ~ globals                  }....................
 _beartype_conf_lock = Lock()
 '''
@@ -101,43 +101,18 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
     '''
 
     # ..................{ VALIDATE                           }..................
-    # If "claw_decoration_position_funcs" is *NOT* an enumeration member, raise
-    # an exception.
-    if not isinstance(
-        conf_kwargs['claw_decoration_position_funcs'],
-        BeartypeDecorationPosition
-    ):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "claw_decoration_position_funcs" '
-            f'value {repr(conf_kwargs["claw_decoration_position_funcs"])} not '
-            f'"beartype.BeartypeDecorationPosition" enumeration member.'
-        )
-    # Else, "claw_decoration_position_funcs" is an enumeration member.
-    #
-    # If "claw_decoration_position_types" is *NOT* an enumeration member, raise
-    # an exception.
-    elif not isinstance(
-        conf_kwargs['claw_decoration_position_types'],
-        BeartypeDecorationPosition
-    ):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "claw_decoration_position_types" '
-            f'value {repr(conf_kwargs["claw_decoration_position_types"])} not '
-            f'"beartype.BeartypeDecorationPosition" enumeration member.'
-        )
-    # Else, "claw_decoration_position_types" is an enumeration member.
-    #
-    # If "claw_is_pep526" is *NOT* a boolean, raise an exception.
-    elif not isinstance(conf_kwargs['claw_is_pep526'], bool):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "claw_is_pep526" '
-            f'value {repr(conf_kwargs["claw_is_pep526"])} not boolean.'
-        )
-    # Else, "claw_is_pep526" is a boolean.
-    #
+    # Note that parameters are intentionally validated in a fixed order
+    # (i.e., "claw_*" parameters, then all remaining parameters). Doing so
+    # ensures that the exception raised for a configuration with two or more
+    # invalid parameters consistently describes the same parameter.
+
+    # If one or more "claw_*" parameters preceding "claw_skip_package_names"
+    # are *NOT* instances of the expected types, raise an exception.
+    _die_if_conf_kwargs_types_invalid(conf_kwargs, _ARG_NAME_TYPES_DESC_CLAW)
+
     # If "claw_skip_package_names" is *NOT* an iterable of non-empty strings,
     # raise an exception. Specifically, if the value of this parameter is not...
-    elif not (
+    if not (
         # A collection *AND*...
         isinstance(conf_kwargs['claw_skip_package_names'], CollectionABC) and
         all(
@@ -157,65 +132,14 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
             f'collection of non-empty strings.'
         )
     # Else, "claw_skip_package_names" is an iterable of non-empty strings.
-    #
-    # If "hint_overrides" is *NOT* a frozen dict, raise an exception.
-    elif not isinstance(conf_kwargs['hint_overrides'], BeartypeHintOverrides):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "hint_overrides" '
-            f'value {repr(conf_kwargs["hint_overrides"])} not '
-            f'frozen dictionary '
-            f'(i.e., "beartype.BeartypeHintOverrides" instance).'
-        )
-    # Else, "hint_overrides" is a frozen dict.
-    #
-    # If "is_color" is *NOT* a tri-state boolean, raise an exception.
-    elif not isinstance(conf_kwargs['is_color'], NoneTypeOr[bool]):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "is_color" '
-            f'value {repr(conf_kwargs["is_color"])} not tri-state boolean '
-            f'(i.e., "True", "False", or "None").'
-        )
-    # Else, "is_color" is a tri-state boolean.
-    #
-    # If "is_debug" is *NOT* a boolean, raise an exception.
-    elif not isinstance(conf_kwargs['is_debug'], bool):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "is_debug" '
-            f'value {repr(conf_kwargs["is_debug"])} not boolean.'
-        )
-    # Else, "is_debug" is a boolean.
-    #
-    # If "is_pep484_tower" is *NOT* a boolean, raise an exception.
-    elif not isinstance(conf_kwargs['is_pep484_tower'], bool):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "is_pep484_tower" '
-            f'value {repr(conf_kwargs["is_debug"])} not boolean.'
-        )
-    # Else, "is_pep484_tower" is a boolean.
-    #
-    # If "strategy" is *NOT* an enumeration member, raise an exception.
-    elif not isinstance(conf_kwargs['strategy'], BeartypeStrategy):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "strategy" '
-            f'value {repr(conf_kwargs["strategy"])} not '
-            f'"beartype.BeartypeStrategy" enumeration member.'
-        )
-    # Else, "strategy" is an enumeration member.
-    #
-    # If "violation_verbosity" is *NOT* an enumeration member, raise an
-    # exception.
-    elif not isinstance(
-        conf_kwargs['violation_verbosity'], BeartypeViolationVerbosity):
-        raise BeartypeConfParamException(
-            f'Beartype configuration parameter "violation_verbosity" '
-            f'value {repr(conf_kwargs["violation_verbosity"])} not '
-            f'"beartype.BeartypeViolationVerbosity" enumeration member.'
-        )
-    # Else, "violation_verbosity" is an enumeration member.
-    #
+
+    # If one or more parameters following "claw_skip_package_names" are *NOT*
+    # instances of the expected types, raise an exception.
+    _die_if_conf_kwargs_types_invalid(conf_kwargs, _ARG_NAME_TYPES_DESC)
+
     # If "warning_cls_on_decorator_exception" is neither "None" *NOR* a
     # warning category, raise an exception.
-    elif not (
+    if not (
         conf_kwargs['warning_cls_on_decorator_exception'] is None or
         is_type_subclass(
             conf_kwargs['warning_cls_on_decorator_exception'], Warning)
@@ -389,3 +313,103 @@ Tuple of the names of all keyword parameters to the
 :meth:`beartype.BeartypeConf.__new__` dunder method whose values are expected to
 be exception subclasses.
 '''
+
+
+_ARG_NAME_TYPES_DESC_CLAW = (
+    (
+        'claw_decoration_position_funcs',
+        BeartypeDecorationPosition,
+        '"beartype.BeartypeDecorationPosition" enumeration member',
+    ),
+    (
+        'claw_decoration_position_types',
+        BeartypeDecorationPosition,
+        '"beartype.BeartypeDecorationPosition" enumeration member',
+    ),
+    ('claw_is_pep526', bool, 'boolean'),
+)
+'''
+Tuple of 3-tuples ``(arg_name, arg_types, arg_types_desc)`` describing all
+keyword parameters to the :meth:`beartype.BeartypeConf.__new__` dunder method
+preceding the ``claw_skip_package_names`` parameter whose values are expected to
+be instances of one or more types.
+
+See Also
+--------
+:data:`._ARG_NAME_TYPES_DESC`
+    Further details.
+'''
+
+
+_ARG_NAME_TYPES_DESC = (
+    (
+        'hint_overrides',
+        BeartypeHintOverrides,
+        'frozen dictionary (i.e., "beartype.BeartypeHintOverrides" instance)',
+    ),
+    (
+        'is_color',
+        NoneTypeOr[bool],
+        'tri-state boolean (i.e., "True", "False", or "None")',
+    ),
+    ('is_debug', bool, 'boolean'),
+    ('is_pep484_tower', bool, 'boolean'),
+    (
+        'strategy',
+        BeartypeStrategy,
+        '"beartype.BeartypeStrategy" enumeration member',
+    ),
+    (
+        'violation_verbosity',
+        BeartypeViolationVerbosity,
+        '"beartype.BeartypeViolationVerbosity" enumeration member',
+    ),
+)
+'''
+Tuple of 3-tuples ``(arg_name, arg_types, arg_types_desc)`` describing all
+keyword parameters to the :meth:`beartype.BeartypeConf.__new__` dunder method
+following the ``claw_skip_package_names`` parameter whose values are expected to
+be instances of one or more types, where:
+
+* ``arg_name`` is the name of that parameter.
+* ``arg_types`` is either a type or tuple of types that the value of that
+  parameter is expected to be an instance of.
+* ``arg_types_desc`` is a human-readable description of those types, embedded
+  in the exception message raised when that value is invalid.
+'''
+
+# ....................{ PRIVATE ~ raisers                  }....................
+def _die_if_conf_kwargs_types_invalid(
+    conf_kwargs: DictStrToAny, arg_name_types_desc: tuple) -> None:
+    '''
+    Raise an exception if the value of one or more configuration parameters
+    described by the passed tuple in the passed dictionary of such parameters
+    is *not* an instance of the types expected for that parameter.
+
+    Parameters
+    ----------
+    conf_kwargs : Dict[str, object]
+        Dictionary mapping from the names to values of *all* possible keyword
+        parameters configuring this configuration.
+    arg_name_types_desc : tuple
+        Tuple of 3-tuples ``(arg_name, arg_types, arg_types_desc)`` describing
+        these parameters (e.g., :data:`._ARG_NAME_TYPES_DESC`).
+
+    Raises
+    ------
+    BeartypeConfParamException
+        If one or more of these configuration parameters are invalid.
+    '''
+
+    # For the name of each keyword parameter whose value is expected to be an
+    # instance of one or more types, those types, and a human-readable
+    # description of those types...
+    for arg_name, arg_types, arg_types_desc in arg_name_types_desc:
+        # If the value of this keyword parameter is *NOT* such an instance,
+        # raise an exception.
+        if not isinstance(conf_kwargs[arg_name], arg_types):
+            raise BeartypeConfParamException(
+                f'Beartype configuration parameter "{arg_name}" '
+                f'value {repr(conf_kwargs[arg_name])} not {arg_types_desc}.'
+            )
+        # Else, the value of this keyword parameter is such an instance.
@@ -12,9 +12,6 @@ against :pep:`484`- and :pep:`604`-compliant type hints).
 This private submodule is *not* intended for importation by downstream callers.
 '''
 
-# ....................{ IMPORTS                            }....................
-from beartype._data.hint.datahinttyping import CallableStrFormat
-
 # ....................{ CODE                               }....................
 CODE_PEP484604_UNION_PREFIX = '''('''
 '''
@@ -32,8 +29,8 @@ pith against each subscripted argument of a :class:`typing.Union` type hint.
 
 
 CODE_PEP484604_UNION_CHILD_NONPEP = '''
-{{indent_curr}}    # True only if this pith is of one of these types.
-{{indent_curr}}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
+{indent_curr}    # True only if this pith is of one of these types.
+{indent_curr}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current PEP-noncompliant child argument subscripting a parent
@@ -47,7 +44,7 @@ See Also
 
 
 CODE_PEP484604_UNION_CHILD_PEP = '''
-{{indent_curr}}    {hint_child_placeholder} or'''
+{indent_curr}    {hint_child_placeholder} or'''
 '''
 :pep:`484`-compliant code snippet type-checking the current pith against the
 current PEP-compliant child argument subscripting a parent :class:`typing.Union`
@@ -60,16 +57,50 @@ applying this snippet to the last subscripted argument of such a hint. While
 there exist alternate and more readable means of accomplishing this, this
 approach is the optimally efficient.
 
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent hint has been generated.
+The ``{indent_curr}`` format variable is intentionally interpolated into each
+such snippet as that snippet is formatted rather than deferred until the
+complete PEP-compliant code snippet type-checking the current pith against
+*all* subscripted arguments of this parent hint has been generated. Doing so
+avoids a final pass formatting that complete code snippet.
 '''
 
 # ....................{ FORMATTERS                         }....................
-# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
-# This is an absurd micro-optimization. *fight me, github developer community*
-CODE_PEP484604_UNION_CHILD_PEP_format: CallableStrFormat = (
-    CODE_PEP484604_UNION_CHILD_PEP.format)
-CODE_PEP484604_UNION_CHILD_NONPEP_format: CallableStrFormat = (
-    CODE_PEP484604_UNION_CHILD_NONPEP.format)
+# Formatters interpolating the above snippets, each returning the same string as
+# the str.format() method bound to the corresponding snippet when passed the
+# same keyword parameters. Since these snippets are tiny *AND* formatted once
+# for each child hint of each union, these formatters are intentionally
+# implemented as f-strings precompiled into bytecode rather than as str.format()
+# methods reparsing their snippets on each call. This is an absurd
+# micro-optimization. *fight me, github developer community*
+#
+# Note that these f-strings *MUST* be manually synchronized with the above
+# snippets. The "test_data_code_pep484604" unit test guarantees this.
+
+def CODE_PEP484604_UNION_SUFFIX_format(indent_curr: str) -> str:
+    '''
+    :data:`.CODE_PEP484604_UNION_SUFFIX` formatted by the passed parameters.
+    '''
+
+    return f'\n{indent_curr})'
+
+
+def CODE_PEP484604_UNION_CHILD_NONPEP_format(
+    indent_curr: str, pith_curr_expr: str, hint_curr_expr: str) -> str:
+    '''
+    :data:`.CODE_PEP484604_UNION_CHILD_NONPEP` formatted by the passed
+    parameters.
+    '''
+
+    return (
+        f'\n{indent_curr}    # True only if this pith is of one of these types.'
+        f'\n{indent_curr}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'
+    )
+
+
+def CODE_PEP484604_UNION_CHILD_PEP_format(
+    indent_curr: str, hint_child_placeholder: str) -> str:
+    '''
+    :data:`.CODE_PEP484604_UNION_CHILD_PEP` formatted by the passed parameters.
+    '''
+
+    return f'\n{indent_curr}    {hint_child_placeholder} or'
@@ -19,7 +19,6 @@ This private submodule is *not* intended for importation by downstream callers.
 #    https://peps.python.org/pep-0742
 
 # ....................{ IMPORTS                            }....................
-import beartype #  <-- satisfy mypy [note to self: i can't stand you, mypy]
 from ast import (
     AST,
     AsyncFunctionDef,
@@ -27,7 +26,7 @@ from ast import (
     FunctionDef,
 )
 from beartype.typing import (
-    # TYPE_CHECKING,
+    TYPE_CHECKING,
     AbstractSet,
     Any,
     Callable,
@@ -66,6 +65,14 @@ from types import (
     GeneratorType,
 )
 
+# If this submodule is currently being statically type-checked (e.g., mypy),
+# import the root "beartype" package. Static type-checkers require this import
+# to resolve the fully-qualified forward reference subscripting the
+# "BeartypeForwardRef" type hint defined below. At runtime, this import is
+# pointless and thus intentionally avoided.
+if TYPE_CHECKING:
+    import beartype #  <-- satisfy mypy [note to self: i can't stand you, mypy]
+
 # ....................{ AST                                }....................
 NodeCallable = Union[FunctionDef, AsyncFunctionDef]
 '''
@@ -470,6 +477,12 @@ PEP-compliant type hint matching an iterable of zero or more types.
 '''
 
 
+ListTypes = List[type]
+'''
+PEP-compliant type hint matching a list of zero or more types.
+'''
+
+
 SetTypes = Set[type]
 '''
 PEP-compliant type hint matching a set of zero or more types.
@@ -287,6 +287,7 @@ def make_node_call(
     Call
         Callable call node calling this callable with these parameters.
     '''
+    assert isinstance(func_name, str), f'{repr(func_name)} not string.'
     assert isinstance(nodes_args, list), f'{repr(nodes_args)} not list.'
     assert isinstance(nodes_kwargs, list), f'{repr(nodes_kwargs)} not list.'
     assert all(
@@ -297,8 +298,12 @@ def make_node_call(
         f'{repr(nodes_kwargs)} not list of AST keyword nodes.')
 
     # Child node referencing the callable to be called.
-    node_func_name = make_node_name_load(
-        name=func_name, node_sibling=node_sibling)
+    #
+    # Note that this node is intentionally instantiated directly rather than
+    # by calling the make_node_name_load() factory. Doing so enables source
+    # code metadata to be copied onto both this node and the parent node
+    # created below with only a single call to copy_node_metadata().
+    node_func_name = Name(func_name, ctx=NODE_CONTEXT_LOAD)
 
     # Child node calling this callable.
     node_func_call = Call(
@@ -307,8 +312,9 @@ def make_node_call(
         keywords=nodes_kwargs,
     )
 
-    # Copy source code metadata from this sibling node onto this new node.
-    copy_node_metadata(node_src=node_sibling, node_trg=node_func_call)
+    # Copy source code metadata from this sibling node onto these new nodes.
+    copy_node_metadata(
+        node_src=node_sibling, node_trg=(node_func_name, node_func_call))
 
     # Return this call node.
     return node_func_call
@@ -28,6 +28,7 @@ from beartype._util.module.utilmodtest import (
     is_object_module_thirdparty_blacklisted)
 
 # ....................{ TESTERS                            }....................
+@callable_cached
 def is_hint_pep484585_generic_user(hint: Hint) -> bool:
     '''
     :data:`True` only if the passed :pep:`484`- or :pep:`585`-compliant generic
@@ -41,9 +42,11 @@ def is_hint_pep484585_generic_user(hint: Hint) -> bool:
       :mod:`typing` module (e.g., :class:`typing.Generic`) *nor*...
     * A :pep:`585`-compliant superclass (e.g., ``list[T]``).
 
-    This tester is intentionally *not* memoized (e.g., by the
-    ``callable_cached`` decorator), as the implementation trivially reduces to
-    an efficient one-liner.
+    This tester is memoized for efficiency. Although the implementation reduces
+    to a one-liner, that one-liner calls several lower-level testers and getters
+    that are considerably costlier in aggregate than a dictionary lookup. This
+    tester is also repeatedly called on the same pseudo-superclasses while
+    iterating over the erased bases of generics.
 
     Parameters
     ----------
@@ -290,17 +293,48 @@ def _is_hint_pep484585_generic_blacklisted(hint: Hint) -> bool:
     #   generic underlying this subscripted generic.
     hint_type = get_hint_pep484585_generic_type(hint)
 
-    # For each possibly erased superclass of this generic, arbitrarily iterated
-    # according to the method resolution order (MRO) for this generic...
-    for hint_base in hint_type.__mro__:
+    # Return true only if this unsubscripted generic is beartype-blacklisted.
+    #
+    # Note that this test is intentionally deferred to a lower-level tester
+    # memoized on this unsubscripted generic rather than this possibly
+    # subscripted generic. Doing so enables all subscriptions of the same
+    # generic (e.g., "MuhGeneric[int]", "MuhGeneric[str]") to share the same
+    # iteration over the method resolution order (MRO) of that generic.
+    return _is_type_mro_blacklisted(hint_type)
+
+
+@callable_cached
+def _is_type_mro_blacklisted(cls: type) -> bool:
+    '''
+    :data:`True` only if one or more superclasses in the method resolution
+    order (MRO) of the passed class are **beartype-blacklisted** (i.e., defined
+    in a third-party package or module known to be hostile to runtime
+    type-checking).
+
+    This tester is memoized for efficiency.
+
+    Parameters
+    ----------
+    cls : type
+        Class to be inspected.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this class is beartype-blacklisted.
+    '''
+
+    # For each possibly erased superclass of this class, arbitrarily iterated
+    # according to the method resolution order (MRO) for this class...
+    for cls_base in cls.__mro__:
         # If this superclass is beartype-blacklisted (i.e., defined in a
         # third-party package or module known to be hostile to runtime
         # type-checking), return true immediately.
-        if is_object_module_thirdparty_blacklisted(hint_base):
+        if is_object_module_thirdparty_blacklisted(cls_base):
             return True
         # Else, this superclass is *NOT* beartype-blacklisted. In this case,
-        # continue to the next such superclass of this generic.
-    # Else, all superclasses of this generic are *NOT* beartype-blacklisted.
+        # continue to the next such superclass of this class.
+    # Else, all superclasses of this class are *NOT* beartype-blacklisted.
 
     # Return false as a sane fallback.
     return False
@@ -137,13 +137,23 @@ metadata).
 '''
 
 # ....................{ METADATA ~ version                 }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: Changes to this version string *MUST* be synchronized with the
+# "VERSION_PARTS" tuple defined below. The "test_api_meta_version" unit test
+# validates these two globals to be synchronized.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 VERSION = '0.20.0rc0'
 '''
 Human-readable package version as a ``.``-delimited string.
 '''
 
 
-VERSION_PARTS = _convert_str_version_to_tuple(VERSION)
+# Note that this tuple is intentionally defined as a literal rather than
+# dynamically parsed from the "VERSION" string defined above. Doing so avoids
+# one call to the _convert_str_version_to_tuple() parser at importation time.
+# That parser is still called above to parse the "PYTHON_VERSION_MIN" string,
+# whose value is read from package metadata and thus *CANNOT* be a literal.
+VERSION_PARTS = (0, 20, 0)
 '''
 Machine-readable package version as a tuple of integers.
 '''
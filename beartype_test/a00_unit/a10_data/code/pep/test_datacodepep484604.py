@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`484` and :pep:`604` **type-checking expression snippet unit
+tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._data.code.pep.datacodepep484604` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_data_code_pep484604() -> None:
+    '''
+    Test that the f-string formatters defined by the
+    :mod:`beartype._data.code.pep.datacodepep484604` submodule return the same
+    strings as the :meth:`str.format` methods bound to their corresponding
+    snippets.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._data.code.pep.datacodepep484604 import (
+        CODE_PEP484604_UNION_CHILD_NONPEP,
+        CODE_PEP484604_UNION_CHILD_NONPEP_format,
+        CODE_PEP484604_UNION_CHILD_PEP,
+        CODE_PEP484604_UNION_CHILD_PEP_format,
+        CODE_PEP484604_UNION_SUFFIX,
+        CODE_PEP484604_UNION_SUFFIX_format,
+    )
+
+    # ....................{ LOCALS                         }....................
+    # Arbitrary keyword parameters to be passed to these formatters.
+    indent_curr = '        '
+    kwargs_nonpep = dict(
+        indent_curr=indent_curr,
+        pith_curr_expr='(__beartype_pith_1 := __beartype_pith_0[0])',
+        hint_curr_expr='__beartype_object_140',
+    )
+    kwargs_pep = dict(indent_curr=indent_curr, hint_child_placeholder='@{1}!')
+
+    # ....................{ PASS                           }....................
+    # Assert each formatter returns the expected string.
+    assert CODE_PEP484604_UNION_SUFFIX_format(indent_curr=indent_curr) == (
+        CODE_PEP484604_UNION_SUFFIX.format(indent_curr=indent_curr))
+    assert CODE_PEP484604_UNION_CHILD_NONPEP_format(**kwargs_nonpep) == (
+        CODE_PEP484604_UNION_CHILD_NONPEP.format(**kwargs_nonpep))
+    assert CODE_PEP484604_UNION_CHILD_PEP_format(**kwargs_pep) == (
+        CODE_PEP484604_UNION_CHILD_PEP.format(**kwargs_pep))
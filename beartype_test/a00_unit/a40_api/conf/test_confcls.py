@@ -43,6 +43,15 @@ def test_conf_dataclass() -> None:
         beartype_hint_overrides_pep484_tower,
     )
     from beartype._util.utilobject import get_object_type_basename
+    from copy import (
+        copy,
+        deepcopy,
+    )
+    from pickle import (
+        HIGHEST_PROTOCOL,
+        dumps,
+        loads,
+    )
     from pytest import raises
 
     # ....................{ CLASSES                        }....................
@@ -246,6 +255,25 @@ def test_conf_dataclass() -> None:
     assert BEAR_CONF_DEFAULT == BeartypeConf()
     assert BEAR_CONF_NONDEFAULT == BeartypeConf(**BEAR_CONF_NONDEFAULT_KWARGS)
 
+    # ....................{ PASS ~ kwargs                  }....................
+    # Assert that the keyword mapping of both the default and non-default
+    # configurations encapsulates the same number of configuration parameters
+    # as the tuple of positional parameters keying these configurations.
+    assert len(BEAR_CONF_DEFAULT.kwargs) == len(BEAR_CONF_DEFAULT._conf_args)
+    assert len(BEAR_CONF_NONDEFAULT.kwargs) == len(
+        BEAR_CONF_NONDEFAULT._conf_args)
+
+    # Assert that the keyword mapping of the non-default configuration maps
+    # from the names to values of the parameters instantiating that
+    # configuration.
+    assert BEAR_CONF_NONDEFAULT.kwargs['is_debug'] is True
+    assert BEAR_CONF_NONDEFAULT.kwargs['strategy'] is BeartypeStrategy.Ologn
+
+    # Assert that shallow copies of this mapping are mutable dictionaries.
+    BEAR_CONF_DEFAULT_KWARGS = BEAR_CONF_DEFAULT.kwargs.copy()
+    BEAR_CONF_DEFAULT_KWARGS['is_debug'] = True
+    assert BEAR_CONF_DEFAULT.kwargs['is_debug'] is False
+
     # ....................{ PASS ~ hash                    }....................
     # Assert that two identical configurations hash equal.
     assert hash(BEAR_CONF_DEFAULT) == hash(BeartypeConf())
@@ -255,6 +283,28 @@ def test_conf_dataclass() -> None:
     # Assert that two differing configurations hash unequal.
     assert hash(BEAR_CONF_DEFAULT) != hash(BEAR_CONF_NONDEFAULT)
 
+    # ....................{ PASS ~ copy                    }....................
+    # Assert that pickling and unpickling configurations across all pickle
+    # protocols reduces to the same self-memoized configurations *WITHOUT*
+    # modifying the default configuration.
+    #
+    # Note that the non-default configuration is intentionally *NOT* pickled
+    # here, as the hint overrides of that configuration reference a local class
+    # that is unpicklable by design.
+    for pickle_protocol in range(HIGHEST_PROTOCOL + 1):
+        assert loads(dumps(
+            BEAR_CONF_DEFAULT, protocol=pickle_protocol)) is BEAR_CONF_DEFAULT
+        assert loads(dumps(
+            BEAR_CONF_NONDEFAULT_VIOLATION_DOOR, protocol=pickle_protocol)) is (
+            BEAR_CONF_NONDEFAULT_VIOLATION_DOOR)
+    assert BEAR_CONF_DEFAULT.violation_door_type is BeartypeDoorHintViolation
+
+    # Assert that shallow and deep copies of configurations reduce to the same
+    # self-memoized configurations.
+    assert copy(BEAR_CONF_NONDEFAULT) is BEAR_CONF_NONDEFAULT
+    assert deepcopy(BEAR_CONF_DEFAULT) is BEAR_CONF_DEFAULT
+    assert deepcopy(BEAR_CONF_NONDEFAULT) is BEAR_CONF_NONDEFAULT
+
     # ....................{ PASS ~ repr                    }....................
     # Unqualified basename of the class of all beartype configurations.
     BEAR_CONF_BASENAME = get_object_type_basename(BEAR_CONF_DEFAULT)
@@ -311,6 +361,20 @@ def test_conf_dataclass() -> None:
             for package_name in (
                 'Its_swinging_boughs', 'to_each_inconstant_blast',)
         ))
+
+    # Assert that instantiating a configuration with multiple invalid
+    # parameters raises the expected exception describing the first such
+    # parameter to be validated.
+    with raises(BeartypeConfParamException, match='claw_skip_package_names'):
+        BeartypeConf(
+            claw_skip_package_names=('Nor_ever', b'one'),
+            is_debug='The long and the short of it',
+        )
+    with raises(BeartypeConfParamException, match='is_debug'):
+        BeartypeConf(
+            is_debug='And the sovereign of the sun',
+            warning_cls_on_decorator_exception=RuntimeError,
+        )
     with raises(BeartypeConfParamException):
         BeartypeConf(hint_overrides=(
             'Wildered, and wan, and panting, she returned.'))
@@ -405,6 +469,11 @@ def test_conf_dataclass() -> None:
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.warning_cls_on_decorator_exception = None
 
+    # Assert that attempting to modify the keyword mapping of this dataclass
+    # raises the expected exception.
+    with raises(TypeError):
+        BEAR_CONF_DEFAULT.kwargs['is_debug'] = True
+
 # ....................{ TESTS ~ arg                        }....................
 def test_conf_is_color(monkeypatch: 'pytest.MonkeyPatch') -> None:
     '''
@@ -39,3 +39,24 @@ def test_api_meta() -> None:
     assert isinstance(meta.URL_HOMEPAGE, str)
     assert isinstance(meta.URL_DOWNLOAD, str)
     assert isinstance(meta.URL_ISSUES, str)
+
+
+def test_api_meta_version() -> None:
+    '''
+    Test that the machine-readable version tuple published by the
+    :mod:`beartype.meta` submodule is synchronized with the human-readable
+    version string published by that submodule.
+    '''
+
+    # Defer test-specific imports.
+    import beartype
+    from beartype import meta
+    from beartype._util.text.utiltextversion import (
+        convert_str_version_to_tuple)
+
+    # Assert this tuple to be the machine-readable equivalent of this string.
+    assert meta.VERSION_PARTS == convert_str_version_to_tuple(meta.VERSION)
+
+    # Assert the PEP 8-compliant package globals to alias these constants.
+    assert beartype.__version__ == meta.VERSION
+    assert beartype.__version_info__ == meta.VERSION_PARTS
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`484`- **and** :pep:`604`-compliant **union code generator
+unit tests.**
+
+This submodule unit tests the private
+:mod:`beartype._check.code.pep.codepep484604` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_get_hint_pep484604_union_args_flattened() -> None:
+    '''
+    Test the private
+    :func:`beartype._check.code.pep.codepep484604._get_hint_pep484604_union_args_flattened`
+    getter.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype.typing import (
+        Annotated,
+        List,
+        Union,
+    )
+    from beartype.vale import Is
+    from beartype._check.code.pep.codepep484604 import (
+        _get_hint_pep484604_union_args_flattened)
+    from beartype._conf.confcommon import BEARTYPE_CONF_DEFAULT
+    from beartype._util.kind.map.utilmapfrozen import FROZEN_DICT_EMPTY
+
+    # ....................{ CLASSES                        }....................
+    class ArrayLike(object):
+        '''
+        Array-like class whose instances mimic NumPy arrays by both returning
+        non-boolean objects when compared for equality *and* raising exceptions
+        when coerced into booleans.
+        '''
+
+        def __eq__(self, other: object) -> 'ArrayLike':
+            return self
+
+        def __bool__(self) -> bool:
+            raise ValueError(
+                'Lost in the wilderness of his own mind.')
+
+        __hash__ = object.__hash__
+
+    # ....................{ LOCALS                         }....................
+    # Arbitrary beartype validator.
+    IsTrue = Is[lambda obj: True]
+
+    # ....................{ PASS                           }....................
+    # Assert that this getter deduplicates PEP-compliant child hints reduced to
+    # the same hint while preserving their original order. Here, the
+    # "Annotated[List[int], ...]" child hint annotated by non-beartype metadata
+    # is reduced to the "List[int]" child hint already subscripting this union.
+    hint_childs_pep, hint_childs_nonpep = (
+        _get_hint_pep484604_union_args_flattened(
+            Union[Annotated[List[int], 'Dark orbs'], List[int], str],
+            BEARTYPE_CONF_DEFAULT,
+            None,
+            FROZEN_DICT_EMPTY,
+            '',
+        ))
+    assert hint_childs_pep == (List[int],)
+    assert hint_childs_nonpep == (str,)
+
+    # PEP-compliant child hints annotated by array-like metadata, whose
+    # equality comparisons raise exceptions when coerced into booleans.
+    hint_child_array_like_a = Annotated[int, IsTrue, ArrayLike()]
+    hint_child_array_like_b = Annotated[int, IsTrue, ArrayLike()]
+
+    # Assert that this getter preserves these child hints as is *WITHOUT*
+    # raising exceptions from their equality comparisons.
+    hint_childs_pep, hint_childs_nonpep = (
+        _get_hint_pep484604_union_args_flattened(
+            Union[hint_child_array_like_a, hint_child_array_like_b],
+            BEARTYPE_CONF_DEFAULT,
+            None,
+            FROZEN_DICT_EMPTY,
+            '',
+        ))
+    assert len(hint_childs_pep) == 2
+    assert hint_childs_pep[0] is hint_child_array_like_a
+    assert hint_childs_pep[1] is hint_child_array_like_b
+    assert hint_childs_nonpep == ()
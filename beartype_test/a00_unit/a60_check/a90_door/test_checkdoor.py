@@ -456,3 +456,35 @@ def test_door_typehint_is_bearable(iter_hints_piths_meta) -> None:
             # pith and hint.
             assert TypeHint(hint).is_bearable(pith, conf=conf) is (
                 is_bearable_expected)
+
+
+def test_door_is_bearable_unhashable() -> None:
+    '''
+    Test the :class:`beartype.door.is_bearable` tester function when passed
+    **unhashable type hints** (i.e., hints *not* memoizable by the
+    ``@callable_cached`` decorator).
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype.door import is_bearable
+    from beartype.typing import Annotated
+    from beartype._check.checkmake import make_func_tester
+    from beartype._util.utilobject import is_object_hashable
+
+    # ....................{ LOCALS                         }....................
+    # Unhashable type hint annotated by an unhashable object.
+    hint_unhashable = Annotated[int, []]
+
+    # ....................{ PASS                           }....................
+    # Assert that this hint is unhashable.
+    assert not is_object_hashable(hint_unhashable)
+
+    # Assert this tester returns the expected booleans when passed this hint.
+    assert is_bearable(0xBEEF, hint_unhashable) is True
+    assert is_bearable('Bear with me.', hint_unhashable) is False
+
+    # Assert that the factory underlying this tester memoizes this hint by
+    # object identity despite this hint being unhashable.
+    assert make_func_tester(hint_unhashable) is make_func_tester(
+        hint_unhashable)